@@ -809,9 +809,24 @@ def autolog(
                      `fit()`, `fit_transform()`, ...).
         :param kwargs: The keyword arguments passed to the scikit-learn training routine.
         """
-        if hasattr(estimator, "score"):
+        # Resolve the argument names of the training routine once and share them among
+        # all of the post-training metadata that is derived from the training arguments
+        try:
+            fit_arg_names = _get_arg_names(estimator.fit)
+        except Exception as e:
+            msg = (
+                "Failed to inspect the arguments of "
+                + estimator.fit.__qualname__
+                + ". The training score, metrics, artifacts and input example will not be"
+                + " recorded. Inspection error: "
+                + str(e)
+            )
+            _logger.warning(msg)
+            fit_arg_names = None
+
+        if fit_arg_names is not None and hasattr(estimator, "score"):
             try:
-                score_args = _get_args_for_score(estimator.score, estimator.fit, args, kwargs)
+                score_args = _get_args_for_score(estimator.score, fit_arg_names, args, kwargs)
                 training_score = estimator.score(*score_args)
             except Exception as e:
                 msg = (
@@ -824,12 +839,16 @@ def autolog(
                 try_mlflow_log(mlflow.log_metric, "training_score", training_score)
 
         # log common metrics and artifacts for estimators (classifier, regressor)
-        _log_specialized_estimator_content(estimator, mlflow.active_run().info.run_id, args, kwargs)
+        if fit_arg_names is not None:
+            _log_specialized_estimator_content(
+                estimator, mlflow.active_run().info.run_id, fit_arg_names, args, kwargs
+            )
 
         def get_input_example():
+            if fit_arg_names is None:
+                raise Exception("the arguments of the training routine could not be inspected")
             # Fetch an input example using the first several rows of the array-like
             # training data supplied to the training routine (e.g., `fit()`)
-            fit_arg_names = _get_arg_names(estimator.fit)
             X_var_name, y_var_name = fit_arg_names[:2]
             input_example = _get_Xy(args, kwargs, X_var_name, y_var_name)[0][
                 :INPUT_EXAMPLE_SAMPLE_ROWS
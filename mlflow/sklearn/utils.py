@@ -1,11 +1,14 @@
 import collections
 from distutils.version import LooseVersion
-from itertools import islice
+import functools
 import inspect
+from inspect import Parameter
 import logging
 from numbers import Number
 import numpy as np
 import time
+import types
+import weakref
 
 from mlflow.entities import Metric, Param
 from mlflow.tracking.client import MlflowClient
@@ -31,16 +34,81 @@ _TRAINING_PREFIX = "training_"
 
 _SAMPLE_WEIGHT = "sample_weight"
 
+# Target types (as returned by `sklearn.utils.multiclass.type_of_target`) for which the
+# classification metrics can be computed
+_SUPPORTED_CLASSIFICATION_TARGET_TYPES = ("binary", "multiclass", "multilabel-indicator")
+
 # _SklearnArtifact represents a artifact (e.g confusion matrix) that will be computed and
 # logged during the autologging routine for a particular model type (eg, classifier, regressor).
+# `function_name` is the name of the public scikit-learn plotting function that is reported to
+# users when the artifact fails to be computed, which may differ from the name of `function`.
 _SklearnArtifact = collections.namedtuple(
-    "_SklearnArtifact", ["name", "function", "arguments", "title"]
+    "_SklearnArtifact", ["name", "function", "function_name", "arguments", "title"]
 )
 
 # _SklearnMetric represents a metric (e.g, precision_score) that will be computed and
 # logged during the autologging routine for a particular model type (eg, classifier, regressor).
 _SklearnMetric = collections.namedtuple("_SklearnMetric", ["name", "function", "arguments"])
 
+# _SklearnMetricSpec describes a metric that is computed from the labels, predictions and
+# sample weights of a training dataset, in terms of the name of its `sklearn.metrics` function
+# and the additional keyword arguments it is called with. The keyword arguments are stored as
+# a tuple of (name, value) pairs so that the module-level specs cannot be mutated across fits.
+# Functions are resolved by name when the metric is computed, since `sklearn` is imported lazily.
+_SklearnMetricSpec = collections.namedtuple(
+    "_SklearnMetricSpec", ["name", "function_name", "arguments"]
+)
+
+# By default, for precision, recall and f1 scores, we choose the parameter `average` to be
+# `weighted`. For accuracy score, we choose `normalize` to be `True` to output the percentage
+# of accuracy. See `_get_classifier_metrics` for more details.
+_CLASSIFIER_METRIC_SPECS = (
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "precision_score",
+        function_name="precision_score",
+        arguments=(("average", "weighted"),),
+    ),
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "recall_score",
+        function_name="recall_score",
+        arguments=(("average", "weighted"),),
+    ),
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "f1_score",
+        function_name="f1_score",
+        arguments=(("average", "weighted"),),
+    ),
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "accuracy_score",
+        function_name="accuracy_score",
+        arguments=(("normalize", True),),
+    ),
+)
+
+# By default, we choose the parameter `multioutput` to be `uniform_average` to average outputs
+# with uniform weight. See `_get_regressor_metrics` for more details.
+_REGRESSOR_METRIC_SPECS = (
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "mse",
+        function_name="mean_squared_error",
+        arguments=(("multioutput", "uniform_average"),),
+    ),
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "mae",
+        function_name="mean_absolute_error",
+        arguments=(("multioutput", "uniform_average"),),
+    ),
+    _SklearnMetricSpec(
+        name=_TRAINING_PREFIX + "r2_score",
+        function_name="r2_score",
+        arguments=(("multioutput", "uniform_average"),),
+    ),
+)
+
+# Predictions of fitted estimators on their training samples, keyed on the estimator and then on
+# the id of the samples. Entries are discarded once autologging for the fit has completed.
+_predictions_cache = weakref.WeakKeyDictionary()
+
 
 def _get_estimator_info_tags(estimator):
     """
@@ -66,14 +134,58 @@ def _get_Xy(args, kwargs, X_var_name, y_var_name):
     return kwargs[X_var_name], kwargs[y_var_name]
 
 
-def _get_samples_labels_and_predictions(fitted_estimator, fit_args, fit_kwargs, fit_arg_names):
+def _get_X_y_and_sample_weight(fit_args, fit_kwargs, fit_arg_names):
+    """
+    Get a tuple of (X, y, sample_weight) in the following steps.
+
+    1. Extract X and y from fit_args and fit_kwargs.
+    2. If the sample_weight argument exists in fit_arg_names, extract it from fit_args
+       or fit_kwargs and return (X, y, sample_weight), otherwise return (X, y, None)
+
+    :param fit_args: Positional arguments given to fit_func.
+    :param fit_kwargs: Keyword arguments given to fit_func.
+    :param fit_arg_names: Argument names of fit_func.
+
+    :returns: A tuple of (X, y, sample_weight).
+    """
     # In most cases, X_var_name and y_var_name become "X" and "y", respectively.
     # However, certain sklearn models use different variable names for X and y.
     X_var_name, y_var_name = fit_arg_names[:2]
-    X, y_true = _get_Xy(fit_args, fit_kwargs, X_var_name, y_var_name)
-    y_pred = fitted_estimator.predict(X)
+    X, y = _get_Xy(fit_args, fit_kwargs, X_var_name, y_var_name)
+    sample_weight = (
+        _get_sample_weight(fit_arg_names, fit_args, fit_kwargs)
+        if _SAMPLE_WEIGHT in fit_arg_names
+        else None
+    )
+
+    return X, y, sample_weight
+
+
+def _get_cached_predictions(fitted_estimator, X):
+    """
+    :return: The result of `fitted_estimator.predict(X)`. Predictions are cached per estimator
+             and sample set so that metrics and artifacts computed for the same fit (e.g.,
+             accuracy score and confusion matrix) only invoke `predict()` once.
+    """
+    try:
+        predictions_by_samples_id = _predictions_cache.setdefault(fitted_estimator, {})
+    except TypeError:
+        # The estimator is either unhashable or does not support weak references
+        return fitted_estimator.predict(X)
+
+    # `X` is referenced by the training arguments for the lifetime of the cache entry,
+    # so its id cannot be reused by another object while the entry exists
+    samples_id = id(X)
+    if samples_id not in predictions_by_samples_id:
+        predictions_by_samples_id[samples_id] = fitted_estimator.predict(X)
+    return predictions_by_samples_id[samples_id]
 
-    return X, y_true, y_pred
+
+def _discard_cached_predictions(fitted_estimator):
+    try:
+        _predictions_cache.pop(fitted_estimator, None)
+    except TypeError:
+        pass
 
 
 def _get_sample_weight(arg_names, args, kwargs):
@@ -84,19 +196,43 @@ def _get_sample_weight(arg_names, args, kwargs):
         return args[sample_weight_index]
 
     # corresponds to: model.fit(X, y, ..., sample_weight=sample_weight)
-    if _SAMPLE_WEIGHT in kwargs:
-        return kwargs[_SAMPLE_WEIGHT]
-
-    return None
+    # or model.fit(X, y), in which case no sample weight is found
+    return kwargs.get(_SAMPLE_WEIGHT)
 
 
 def _get_arg_names(f):
-    # `inspect.getargspec` doesn't return a wrapped function's argspec
-    # See: https://hynek.me/articles/decorators#mangled-signatures
-    return list(inspect.signature(f).parameters.keys())
+    is_bound_method = inspect.ismethod(f)
+    func = f.__func__ if is_bound_method else f
+    # Resolve the function whose signature `inspect.signature` reports for `func`. Callables
+    # that scikit-learn creates on each attribute access (e.g., the wrapper returned for
+    # `Pipeline.score`) reference their estimator, so only the plain functions they wrap
+    # (e.g., the functions defined by an estimator class) are used as cache keys
+    unwrapped = inspect.unwrap(func, stop=lambda obj: hasattr(obj, "__signature__"))
+    if isinstance(unwrapped, types.FunctionType):
+        return list(_get_cached_function_arg_names(unwrapped, is_bound_method))
+    return list(_get_function_arg_names(func, is_bound_method))
 
 
-def _get_args_for_score(score_func, fit_func, fit_args, fit_kwargs):
+@functools.lru_cache(maxsize=1024)
+def _get_cached_function_arg_names(func, is_bound_method):
+    return _get_function_arg_names(func, is_bound_method)
+
+
+def _get_function_arg_names(func, is_bound_method):
+    # `inspect.getargspec` doesn't return a wrapped function's argspec
+    # See: https://hynek.me/articles/decorators#mangled-signatures
+    params = list(inspect.signature(func).parameters.values())
+    # Mirror `inspect.signature` on a bound method, which drops the first positional parameter
+    if (
+        is_bound_method
+        and params
+        and params[0].kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    ):
+        params = params[1:]
+    return tuple(param.name for param in params)
+
+
+def _get_args_for_score(score_func, fit_arg_names, fit_args, fit_kwargs):
     """
     Get arguments to pass to score_func in the following steps.
 
@@ -106,14 +242,13 @@ def _get_args_for_score(score_func, fit_func, fit_args, fit_kwargs):
        otherwise return (X, y)
 
     :param score_func: A score function object.
-    :param fit_func: A fit function object.
+    :param fit_arg_names: Argument names of fit_func.
     :param fit_args: Positional arguments given to fit_func.
     :param fit_kwargs: Keyword arguments given to fit_func.
 
     :returns: A tuple of either (X, y, sample_weight) or (X, y).
     """
     score_arg_names = _get_arg_names(score_func)
-    fit_arg_names = _get_arg_names(fit_func)
 
     # In most cases, X_var_name and y_var_name become "X" and "y", respectively.
     # However, certain sklearn models use different variable names for X and y.
@@ -128,6 +263,25 @@ def _get_args_for_score(score_func, fit_func, fit_args, fit_kwargs):
     return Xy
 
 
+def _get_metrics_from_specs(metric_specs, y_true, y_pred, sample_weight):
+    """
+    :return: A list of `_SklearnMetric` objects that compute the metrics described by
+             `metric_specs` from the specified labels, predictions and sample weights.
+    """
+    import sklearn
+
+    return [
+        _SklearnMetric(
+            name=spec.name,
+            function=getattr(sklearn.metrics, spec.function_name),
+            arguments=dict(
+                spec.arguments, y_true=y_true, y_pred=y_pred, sample_weight=sample_weight
+            ),
+        )
+        for spec in metric_specs
+    ]
+
+
 def _get_metrics_value_dict(metrics_list):
     metric_value_dict = {}
     for metric in metrics_list:
@@ -140,7 +294,7 @@ def _get_metrics_value_dict(metrics_list):
     return metric_value_dict
 
 
-def _get_classifier_metrics(fitted_estimator, fit_args, fit_kwargs):
+def _get_classifier_metrics(fitted_estimator, X, y_true, sample_weight):
     """
     Compute and record various common metrics for classifiers
 
@@ -167,59 +321,39 @@ def _get_classifier_metrics(fitted_estimator, fit_args, fit_kwargs):
     to make the output more insensitive to dataset imbalance.
 
     Steps:
-    1. Extract X and y_true from fit_args and fit_kwargs, and compute y_pred.
-    2. If the sample_weight argument exists in fit_func (accuracy_score by default
-    has sample_weight), extract it from fit_args or fit_kwargs as
-    (y_true, y_pred, ...... sample_weight), otherwise as (y_true, y_pred, ......)
-    3. return a dictionary of metric(name, value)
+    1. If the type of y_true is not supported by these metrics (e.g., multiclass-multioutput),
+    return an empty dictionary.
+    2. Compute y_pred from X.
+    3. Compute each metric as (y_true, y_pred, ...... sample_weight), where sample_weight
+    is `None` if it was not given to fit_func.
+    4. return a dictionary of metric(name, value)
 
     :param fitted_estimator: The already fitted classifier
-    :param fit_args: Positional arguments given to fit_func.
-    :param fit_kwargs: Keyword arguments given to fit_func.
+    :param X: The training samples given to fit_func.
+    :param y_true: The training labels given to fit_func.
+    :param sample_weight: The sample weights given to fit_func, or `None`.
     :return: dictionary of (function name, computed value)
     """
     import sklearn
+    from sklearn.utils.multiclass import type_of_target
+
+    # Every classification metric rejects other target types after validating its inputs, so
+    # check the target type once up front instead of letting each of the metrics fail
+    target_type = type_of_target(y_true)
+    if target_type not in _SUPPORTED_CLASSIFICATION_TARGET_TYPES:
+        _logger.warning(
+            "Training metrics will not be recorded for %s because its target type `%s`"
+            " is not supported by the classification metrics.",
+            fitted_estimator.__class__.__name__,
+            target_type,
+        )
+        return {}
 
-    fit_arg_names = _get_arg_names(fitted_estimator.fit)
-    X, y_true, y_pred = _get_samples_labels_and_predictions(
-        fitted_estimator, fit_args, fit_kwargs, fit_arg_names
-    )
-    sample_weight = (
-        _get_sample_weight(fit_arg_names, fit_args, fit_kwargs)
-        if _SAMPLE_WEIGHT in fit_arg_names
-        else None
-    )
+    y_pred = _get_cached_predictions(fitted_estimator, X)
 
-    classifier_metrics = [
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "precision_score",
-            function=sklearn.metrics.precision_score,
-            arguments=dict(
-                y_true=y_true, y_pred=y_pred, average="weighted", sample_weight=sample_weight
-            ),
-        ),
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "recall_score",
-            function=sklearn.metrics.recall_score,
-            arguments=dict(
-                y_true=y_true, y_pred=y_pred, average="weighted", sample_weight=sample_weight
-            ),
-        ),
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "f1_score",
-            function=sklearn.metrics.f1_score,
-            arguments=dict(
-                y_true=y_true, y_pred=y_pred, average="weighted", sample_weight=sample_weight
-            ),
-        ),
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "accuracy_score",
-            function=sklearn.metrics.accuracy_score,
-            arguments=dict(
-                y_true=y_true, y_pred=y_pred, normalize=True, sample_weight=sample_weight
-            ),
-        ),
-    ]
+    classifier_metrics = _get_metrics_from_specs(
+        _CLASSIFIER_METRIC_SPECS, y_true, y_pred, sample_weight
+    )
 
     if hasattr(fitted_estimator, "predict_proba"):
         y_pred_proba = fitted_estimator.predict_proba(X)
@@ -258,7 +392,7 @@ def _get_classifier_metrics(fitted_estimator, fit_args, fit_kwargs):
     return _get_metrics_value_dict(classifier_metrics)
 
 
-def _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs):
+def _get_classifier_artifacts(fitted_estimator, X, y_true, sample_weight):
     """
     Draw and record various common artifacts for classifier
 
@@ -273,15 +407,14 @@ def _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs):
     https://scikit-learn.org/stable/auto_examples/model_selection/plot_roc.html
 
     Steps:
-    1. Extract X and y_true from fit_args and fit_kwargs, and split into train & test datasets.
-    2. If the sample_weight argument exists in fit_func (accuracy_score by default
-    has sample_weight), extract it from fit_args or fit_kwargs as
-    (y_true, y_pred, sample_weight, multioutput), otherwise as (y_true, y_pred, multioutput)
-    3. return a list of artifacts path to be logged
+    1. Draw each artifact from (estimator, X, y_true, sample_weight), where sample_weight
+    is `None` if it was not given to fit_func.
+    2. return a list of artifacts path to be logged
 
-    :param fitted_estimator: The already fitted regressor
-    :param fit_args: Positional arguments given to fit_func.
-    :param fit_kwargs: Keyword arguments given to fit_func.
+    :param fitted_estimator: The already fitted classifier
+    :param X: The training samples given to fit_func.
+    :param y_true: The training labels given to fit_func.
+    :param sample_weight: The sample weights given to fit_func, or `None`.
     :return: List of artifacts to be logged
     """
     import sklearn
@@ -289,18 +422,11 @@ def _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs):
     if not _is_plotting_supported():
         return []
 
-    fit_arg_names = _get_arg_names(fitted_estimator.fit)
-    X, y_true = _get_Xy(fit_args, fit_kwargs, *fit_arg_names[:2])
-    sample_weight = (
-        _get_sample_weight(fit_arg_names, fit_args, fit_kwargs)
-        if _SAMPLE_WEIGHT in fit_arg_names
-        else None
-    )
-
     classifier_artifacts = [
         _SklearnArtifact(
             name=_TRAINING_PREFIX + "confusion_matrix",
-            function=sklearn.metrics.plot_confusion_matrix,
+            function=_plot_confusion_matrix,
+            function_name="plot_confusion_matrix",
             arguments=dict(
                 estimator=fitted_estimator,
                 X=X,
@@ -321,6 +447,7 @@ def _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs):
                 _SklearnArtifact(
                     name=_TRAINING_PREFIX + "roc_curve",
                     function=sklearn.metrics.plot_roc_curve,
+                    function_name="plot_roc_curve",
                     arguments=dict(
                         estimator=fitted_estimator, X=X, y=y_true, sample_weight=sample_weight,
                     ),
@@ -329,6 +456,7 @@ def _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs):
                 _SklearnArtifact(
                     name=_TRAINING_PREFIX + "precision_recall_curve",
                     function=sklearn.metrics.plot_precision_recall_curve,
+                    function_name="plot_precision_recall_curve",
                     arguments=dict(
                         estimator=fitted_estimator, X=X, y=y_true, sample_weight=sample_weight,
                     ),
@@ -340,7 +468,23 @@ def _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs):
     return classifier_artifacts
 
 
-def _get_regressor_metrics(fitted_estimator, fit_args, fit_kwargs):
+def _plot_confusion_matrix(
+    estimator, X, y_true, sample_weight=None, normalize=None, cmap="viridis"
+):
+    """
+    Equivalent to `sklearn.metrics.plot_confusion_matrix`, except that the confusion matrix is
+    computed from cached predictions that are shared with the metrics logged for the estimator,
+    rather than by calling `estimator.predict()` again.
+    """
+    from sklearn.metrics import confusion_matrix, ConfusionMatrixDisplay
+
+    y_pred = _get_cached_predictions(estimator, X)
+    cm = confusion_matrix(y_true, y_pred, sample_weight=sample_weight, normalize=normalize)
+    display = ConfusionMatrixDisplay(confusion_matrix=cm, display_labels=estimator.classes_)
+    return display.plot(cmap=cmap)
+
+
+def _get_regressor_metrics(fitted_estimator, X, y_true, sample_weight):
     """
     Compute and record various common metrics for regressors
 
@@ -354,62 +498,23 @@ def _get_regressor_metrics(fitted_estimator, fit_args, fit_kwargs):
     to average outputs with uniform weight.
 
     Steps:
-    1. Extract X and y_true from fit_args and fit_kwargs, and compute y_pred.
-    2. If the sample_weight argument exists in fit_func (accuracy_score by default
-    has sample_weight), extract it from fit_args or fit_kwargs as
-    (y_true, y_pred, sample_weight, multioutput), otherwise as (y_true, y_pred, multioutput)
+    1. Compute y_pred from X.
+    2. Compute each metric as (y_true, y_pred, sample_weight, multioutput), where
+    sample_weight is `None` if it was not given to fit_func.
     3. return a dictionary of metric(name, value)
 
     :param fitted_estimator: The already fitted regressor
-    :param fit_args: Positional arguments given to fit_func.
-    :param fit_kwargs: Keyword arguments given to fit_func.
+    :param X: The training samples given to fit_func.
+    :param y_true: The training labels given to fit_func.
+    :param sample_weight: The sample weights given to fit_func, or `None`.
     :return: dictionary of (function name, computed value)
     """
-    import sklearn
+    y_pred = _get_cached_predictions(fitted_estimator, X)
 
-    fit_arg_names = _get_arg_names(fitted_estimator.fit)
-    _, y_true, y_pred = _get_samples_labels_and_predictions(
-        fitted_estimator, fit_args, fit_kwargs, fit_arg_names
-    )
-    sample_weight = (
-        _get_sample_weight(fit_arg_names, fit_args, fit_kwargs)
-        if _SAMPLE_WEIGHT in fit_arg_names
-        else None
+    regressor_metrics = _get_metrics_from_specs(
+        _REGRESSOR_METRIC_SPECS, y_true, y_pred, sample_weight
     )
 
-    regressor_metrics = [
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "mse",
-            function=sklearn.metrics.mean_squared_error,
-            arguments=dict(
-                y_true=y_true,
-                y_pred=y_pred,
-                sample_weight=sample_weight,
-                multioutput="uniform_average",
-            ),
-        ),
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "mae",
-            function=sklearn.metrics.mean_absolute_error,
-            arguments=dict(
-                y_true=y_true,
-                y_pred=y_pred,
-                sample_weight=sample_weight,
-                multioutput="uniform_average",
-            ),
-        ),
-        _SklearnMetric(
-            name=_TRAINING_PREFIX + "r2_score",
-            function=sklearn.metrics.r2_score,
-            arguments=dict(
-                y_true=y_true,
-                y_pred=y_pred,
-                sample_weight=sample_weight,
-                multioutput="uniform_average",
-            ),
-        ),
-    ]
-
     # To be compatible with older versions of scikit-learn (below 0.22.2), where
     # `sklearn.metrics.mean_squared_error` does not have "squared" parameter to calculate `rmse`,
     # we compute it through np.sqrt(<value of mse>)
@@ -422,99 +527,133 @@ def _get_regressor_metrics(fitted_estimator, fit_args, fit_kwargs):
 
 
 def _log_warning_for_metrics(func_name, func_call, err):
-    msg = (
-        func_call.__qualname__
-        + " failed. The metric "
-        + func_name
-        + "will not be recorded."
-        + " Metric error: "
-        + str(err)
+    _logger.warning(
+        "%s failed. The metric %s will not be recorded. Metric error: %s",
+        func_call.__qualname__,
+        func_name,
+        err,
     )
-    _logger.warning(msg)
 
 
-def _log_warning_for_artifacts(func_name, func_call, err):
-    msg = (
-        func_call.__qualname__
-        + " failed. The artifact "
-        + func_name
-        + " will not be recorded."
-        + " Artifact error: "
-        + str(err)
+def _log_warning_for_artifacts(artifact_name, function_name, err):
+    _logger.warning(
+        "%s failed. The artifact %s will not be recorded. Artifact error: %s",
+        function_name,
+        artifact_name,
+        err,
     )
-    _logger.warning(msg)
 
 
-def _log_specialized_estimator_content(fitted_estimator, run_id, fit_args, fit_kwargs):
+def _log_specialized_estimator_content(
+    fitted_estimator, run_id, fit_arg_names, fit_args, fit_kwargs
+):
     import sklearn
 
-    mlflow_client = MlflowClient()
-    name_metric_dict = {}
-    try:
-        if sklearn.base.is_classifier(fitted_estimator):
-            name_metric_dict = _get_classifier_metrics(fitted_estimator, fit_args, fit_kwargs)
+    # The estimator type is determined once per fit rather than cached per estimator class,
+    # since meta estimators (e.g., `Pipeline`, `GridSearchCV`) derive their type from the
+    # estimators they wrap
+    is_classifier = sklearn.base.is_classifier(fitted_estimator)
+    is_regressor = sklearn.base.is_regressor(fitted_estimator)
+
+    # Specialized metrics and artifacts are only computed for classifiers and regressors
+    if not (is_classifier or is_regressor):
+        return
 
-        elif sklearn.base.is_regressor(fitted_estimator):
-            name_metric_dict = _get_regressor_metrics(fitted_estimator, fit_args, fit_kwargs)
+    try:
+        # Extract the training samples, labels and sample weights once, and share them among
+        # all of the metrics and artifacts computed for the estimator
+        X, y_true, sample_weight = _get_X_y_and_sample_weight(fit_args, fit_kwargs, fit_arg_names)
     except Exception as err:
-        msg = (
-            "Failed to autolog metrics for "
-            + fitted_estimator.__class__.__name__
-            + ". Logging error: "
-            + str(err)
-        )
-        _logger.warning(msg)
-    else:
-        # batch log all metrics
-        try_mlflow_log(
-            mlflow_client.log_batch,
-            run_id,
-            metrics=[
-                Metric(key=str(key), value=value, timestamp=int(time.time() * 1000), step=0)
-                for key, value in name_metric_dict.items()
-            ],
+        _logger.warning(
+            "Failed to autolog metrics and artifacts for %s. Logging error: %s",
+            fitted_estimator.__class__.__name__,
+            err,
         )
+        return
 
-    if sklearn.base.is_classifier(fitted_estimator):
+    # Constructing a client instantiates the tracking store, so it is deferred until there is
+    # content to upload and then shared by the metric and artifact uploads
+    mlflow_client = None
+
+    try:
+        name_metric_dict = {}
         try:
-            artifacts = _get_classifier_artifacts(fitted_estimator, fit_args, fit_kwargs)
-        except Exception as e:
-            msg = (
-                "Failed to autolog artifacts for "
-                + fitted_estimator.__class__.__name__
-                + ". Logging error: "
-                + str(e)
+            if is_classifier:
+                name_metric_dict = _get_classifier_metrics(
+                    fitted_estimator, X, y_true, sample_weight
+                )
+
+            elif is_regressor:
+                name_metric_dict = _get_regressor_metrics(
+                    fitted_estimator, X, y_true, sample_weight
+                )
+        except Exception as err:
+            _logger.warning(
+                "Failed to autolog metrics for %s. Logging error: %s",
+                fitted_estimator.__class__.__name__,
+                err,
             )
-            _logger.warning(msg)
-            return
-
-        with TempDir() as tmp_dir:
-            for artifact in artifacts:
-                try:
-                    display = artifact.function(**artifact.arguments)
-                    display.ax_.set_title(artifact.title)
-                    filepath = tmp_dir.path("{}.png".format(artifact.name))
-                    display.figure_.savefig(filepath)
-                    import matplotlib.pyplot as plt
-
-                    plt.close(display.figure_)
-                except Exception as e:
-                    _log_warning_for_artifacts(artifact.name, artifact.function, e)
-
-            try_mlflow_log(mlflow_client.log_artifacts, run_id, tmp_dir.path())
+        else:
+            # batch log all metrics, skipping the request entirely if there is nothing to log
+            # (e.g., if every metric failed to compute)
+            if name_metric_dict:
+                if mlflow_client is None:
+                    mlflow_client = MlflowClient()
+                timestamp = int(time.time() * 1000)
+                try_mlflow_log(
+                    mlflow_client.log_batch,
+                    run_id,
+                    metrics=[
+                        Metric(key=str(key), value=value, timestamp=timestamp, step=0)
+                        for key, value in name_metric_dict.items()
+                    ],
+                )
+
+        if is_classifier:
+            try:
+                artifacts = _get_classifier_artifacts(fitted_estimator, X, y_true, sample_weight)
+            except Exception as e:
+                _logger.warning(
+                    "Failed to autolog artifacts for %s. Logging error: %s",
+                    fitted_estimator.__class__.__name__,
+                    e,
+                )
+                return
+
+            with TempDir() as tmp_dir:
+                num_saved_artifacts = 0
+                for artifact in artifacts:
+                    try:
+                        display = artifact.function(**artifact.arguments)
+                        display.ax_.set_title(artifact.title)
+                        filepath = tmp_dir.path("{}.png".format(artifact.name))
+                        display.figure_.savefig(filepath)
+                        import matplotlib.pyplot as plt
+
+                        plt.close(display.figure_)
+                        num_saved_artifacts += 1
+                    except Exception as e:
+                        _log_warning_for_artifacts(artifact.name, artifact.function_name, e)
+
+                if num_saved_artifacts > 0:
+                    if mlflow_client is None:
+                        mlflow_client = MlflowClient()
+                    try_mlflow_log(mlflow_client.log_artifacts, run_id, tmp_dir.path())
+    finally:
+        # Cached predictions are only shared among the metrics and artifacts of a single fit
+        _discard_cached_predictions(fitted_estimator)
 
 
 def _chunk_dict(d, chunk_size):
-    # Copied from: https://stackoverflow.com/a/22878842
-
-    it = iter(d)
-    for _ in range(0, len(d), chunk_size):
-        yield {k: d[k] for k in islice(it, chunk_size)}
+    # Slice a materialized list of items rather than re-indexing `d` by key for every chunk
+    items = list(d.items())
+    for i in range(0, len(items), chunk_size):
+        yield dict(items[i : i + chunk_size])
 
 
 def _truncate_dict(d, max_key_length=None, max_value_length=None):
-    def _truncate_and_ellipsize(value, max_length):
-        return str(value)[: (max_length - 3)] + "..."
+    def _truncate_and_ellipsize(str_value, max_length):
+        return str_value[: (max_length - 3)] + "..."
 
     key_is_none = max_key_length is None
     val_is_none = max_value_length is None
@@ -524,20 +663,31 @@ def _truncate_dict(d, max_key_length=None, max_value_length=None):
 
     truncated = {}
     for k, v in d.items():
-        should_truncate_key = (not key_is_none) and (len(str(k)) > max_key_length)
-        should_truncate_val = (not val_is_none) and (len(str(v)) > max_value_length)
+        # Only stringify keys and values whose length is actually checked, and skip the
+        # conversion for those that are already strings
+        if not key_is_none:
+            str_k = k if type(k) is str else str(k)
+            should_truncate_key = len(str_k) > max_key_length
+        else:
+            should_truncate_key = False
 
-        new_k = _truncate_and_ellipsize(k, max_key_length) if should_truncate_key else k
+        if not val_is_none:
+            str_v = v if type(v) is str else str(v)
+            should_truncate_val = len(str_v) > max_value_length
+        else:
+            should_truncate_val = False
+
+        new_k = _truncate_and_ellipsize(str_k, max_key_length) if should_truncate_key else k
         if should_truncate_key:
             # Use the truncated key for warning logs to avoid noisy printing to stdout
-            msg = "Truncated the key `{}`".format(new_k)
-            _logger.warning(msg)
+            _logger.warning("Truncated the key `%s`", new_k)
 
-        new_v = _truncate_and_ellipsize(v, max_value_length) if should_truncate_val else v
+        new_v = _truncate_and_ellipsize(str_v, max_value_length) if should_truncate_val else v
         if should_truncate_val:
             # Use the truncated key and value for warning logs to avoid noisy printing to stdout
-            msg = "Truncated the value of the key `{}`. Truncated value: `{}`".format(new_k, new_v)
-            _logger.warning(msg)
+            _logger.warning(
+                "Truncated the value of the key `%s`. Truncated value: `%s`", new_k, new_v
+            )
 
         truncated[new_k] = new_v
 
@@ -697,37 +847,51 @@ def _create_child_runs_for_parameter_search(cv_estimator, parent_run, child_tags
         client.set_terminated(run_id=child_run.info.run_id, end_time=child_run_end_time)
 
 
-def _is_supported_version():
+@functools.lru_cache(maxsize=1)
+def _get_sklearn_version():
+    # The installed version of scikit-learn cannot change within a process, so it is only
+    # parsed once
     import sklearn
 
-    return LooseVersion(sklearn.__version__) >= LooseVersion(_MIN_SKLEARN_VERSION)
+    return LooseVersion(sklearn.__version__)
+
+
+@functools.lru_cache(maxsize=1)
+def _is_supported_version():
+    return _get_sklearn_version() >= LooseVersion(_MIN_SKLEARN_VERSION)
 
 
 # Util function to check whether a metric is able to be computed in given sklearn version
+@functools.lru_cache(maxsize=None)
 def _is_metric_supported(metric_name):
-    import sklearn
-
     # This dict can be extended to store special metrics' specific supported versions
     _metric_supported_version = {"roc_auc_score": "0.22.2"}
 
-    return LooseVersion(sklearn.__version__) >= LooseVersion(_metric_supported_version[metric_name])
+    return _get_sklearn_version() >= LooseVersion(_metric_supported_version[metric_name])
 
 
 # Util function to check whether artifact plotting functions are able to be computed
 # in given sklearn version (should >= 0.22.0)
+@functools.lru_cache(maxsize=1)
 def _is_plotting_supported():
-    import sklearn
-
-    return LooseVersion(sklearn.__version__) >= LooseVersion("0.22.0")
+    return _get_sklearn_version() >= LooseVersion("0.22.0")
 
 
 def _all_estimators():
+    # Return a copy so that callers cannot modify the cached list of estimators
+    return list(_get_all_estimators())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_all_estimators():
+    # Crawling the scikit-learn package for estimators is expensive and its result does not
+    # change within a process, so it is only performed once
     try:
         from sklearn.utils import all_estimators
 
-        return all_estimators()
+        return tuple(all_estimators())
     except ImportError:
-        return _backported_all_estimators()
+        return tuple(_backported_all_estimators())
 
 
 def _backported_all_estimators(type_filter=None):
@@ -788,14 +952,13 @@ def _backported_all_estimators(type_filter=None):
         return True
 
     all_classes = []
-    modules_to_ignore = {"tests", "externals", "setup", "conftest"}
+    modules_to_ignore = frozenset({"tests", "externals", "setup", "conftest"})
     root = sklearn.__path__[0]  # sklearn package
     # Ignore deprecation warnings triggered at import time and from walking
     # packages
     with ignore_warnings(category=FutureWarning):
         for _, modname, _ in pkgutil.walk_packages(path=[root], prefix="sklearn."):
-            mod_parts = modname.split(".")
-            if any(part in modules_to_ignore for part in mod_parts) or "._" in modname:
+            if "._" in modname or not modules_to_ignore.isdisjoint(modname.split(".")):
                 continue
             module = import_module(modname)
             classes = inspect.getmembers(module, inspect.isclass)
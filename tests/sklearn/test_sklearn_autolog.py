@@ -1,4 +1,5 @@
 import functools
+import gc
 import inspect
 from unittest import mock
 import os
@@ -11,6 +12,7 @@ import sklearn.base
 import sklearn.datasets
 import sklearn.model_selection
 from scipy.stats import uniform
+import weakref
 
 from mlflow.models import Model
 from mlflow.models.signature import infer_signature
@@ -22,6 +24,7 @@ from mlflow.sklearn.utils import (
     _is_metric_supported,
     _is_plotting_supported,
     _get_arg_names,
+    _chunk_dict,
     _truncate_dict,
 )
 from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID, MLFLOW_AUTOLOGGING
@@ -136,6 +139,13 @@ def test_autolog_preserves_original_function_attributes():
         assert b == a
 
 
+def test_all_estimators_returns_copy_of_cached_estimators():
+    estimators = mlflow.sklearn.utils._all_estimators()
+    assert len(estimators) > 0
+    estimators.clear()
+    assert mlflow.sklearn.utils._all_estimators() != estimators
+
+
 @pytest.mark.skipif(
     _is_supported_version(), reason="This test fails on supported versions of sklearn"
 )
@@ -289,6 +299,66 @@ def test_classifier_multi_class():
     assert_predict_equal(loaded_model, model, X)
 
 
+def test_classifier_predictions_are_shared_by_metrics_and_artifacts():
+    mlflow.sklearn.autolog()
+
+    model = sklearn.svm.SVC()
+    X, y = get_iris()
+    original_predict = sklearn.svm.SVC.predict
+
+    with mlflow.start_run(), mock.patch(
+        "sklearn.svm.SVC.predict", autospec=True, side_effect=original_predict
+    ) as mock_predict:
+        model.fit(X, y)
+
+    # `predict` is called on the training samples once by `score` (for the training score)
+    # and once more for the metrics and the confusion matrix combined
+    predict_calls_on_X = [args for args, _ in mock_predict.call_args_list if args[1] is X]
+    assert len(predict_calls_on_X) == 2
+    assert model not in mlflow.sklearn.utils._predictions_cache
+
+
+def test_classifier_training_arguments_are_extracted_once():
+    mlflow.sklearn.autolog()
+
+    X, y = get_iris()
+    extract = mlflow.sklearn.utils._get_X_y_and_sample_weight
+
+    with mlflow.start_run(), mock.patch(
+        "mlflow.sklearn.utils._get_X_y_and_sample_weight", wraps=extract
+    ) as mock_extract:
+        sklearn.svm.SVC().fit(X, y, sample_weight=np.ones(len(X)))
+
+    mock_extract.assert_called_once()
+
+
+def test_classifier_metrics_are_skipped_for_unsupported_target_types():
+    from sklearn.multioutput import MultiOutputClassifier
+
+    mlflow.sklearn.autolog()
+
+    model = MultiOutputClassifier(sklearn.linear_model.LogisticRegression())
+    X, y = get_iris()
+    # A multiclass-multioutput target is not supported by the classification metrics
+    Y = np.column_stack([y, y])
+
+    with mlflow.start_run() as run, mock.patch(
+        "mlflow.sklearn.utils._logger.warning"
+    ) as mock_warning:
+        model.fit(X, Y)
+
+    target_type_warnings = [
+        args
+        for args, _ in mock_warning.call_args_list
+        if "multiclass-multioutput" in args[0] % args[1:]
+    ]
+    assert len(target_type_warnings) == 1
+
+    _, metrics, _, _ = get_run_data(run.info.run_id)
+    assert TRAINING_SCORE in metrics
+    assert "training_precision_score" not in metrics
+
+
 def test_regressor():
     mlflow.sklearn.autolog()
     # use simple `LinearRegression`, which only implements `fit`.
@@ -317,6 +387,49 @@ def test_regressor():
     assert_predict_equal(loaded_model, model, X)
 
 
+def test_autolog_does_not_log_empty_metrics_batch():
+    mlflow.sklearn.autolog()
+
+    # `KMeans` is neither a classifier nor a regressor, so no specialized metrics are computed
+    with mlflow.start_run(), mock.patch("mlflow.tracking.MlflowClient.log_batch") as mock_log_batch:
+        sklearn.cluster.KMeans().fit(*get_iris())
+
+    assert mock_log_batch.call_count > 0
+    for _, kwargs in mock_log_batch.call_args_list:
+        assert kwargs.get("metrics") or kwargs.get("params") or kwargs.get("tags")
+
+
+def test_autolog_does_not_create_client_when_no_metrics_or_artifacts_are_computed():
+    mlflow.sklearn.autolog()
+
+    def throwing_function(*args, **kwargs):  # pylint: disable=unused-argument
+        raise Exception("EXCEPTION")
+
+    metric_names = ["precision_score", "recall_score", "f1_score", "accuracy_score"]
+    throwing_metrics = {name: throwing_function for name in metric_names}
+    with mock.patch.multiple("sklearn.metrics", **throwing_metrics), mock.patch(
+        "mlflow.sklearn.utils._plot_confusion_matrix", throwing_function
+    ):
+        with mlflow.start_run() as run, mock.patch(
+            "mlflow.sklearn.utils.MlflowClient"
+        ) as mock_client:
+            sklearn.svm.SVC().fit(*get_iris())
+
+    mock_client.assert_not_called()
+    _, metrics, _, artifacts = get_run_data(run.info.run_id)
+    assert list(metrics) == ["training_score"]
+    assert artifacts == [MODEL_DIR]
+
+    # A single client is shared by the metric and artifact uploads
+    with mlflow.start_run(), mock.patch("mlflow.sklearn.utils.MlflowClient") as mock_client:
+        sklearn.svm.SVC().fit(*get_iris())
+
+    assert mock_client.call_count == 1
+    mock_client.return_value.log_batch.assert_called_once()
+    if mlflow.sklearn.utils._is_plotting_supported():
+        mock_client.return_value.log_artifacts.assert_called_once()
+
+
 def test_meta_estimator():
     mlflow.sklearn.autolog()
 
@@ -339,6 +452,27 @@ def test_meta_estimator():
     assert_predict_equal(load_model_by_run_id(run_id), model, X)
 
 
+def test_meta_estimator_metrics_follow_type_of_wrapped_estimator():
+    mlflow.sklearn.autolog()
+
+    X, y = get_iris()
+    classifier = sklearn.pipeline.Pipeline([("svc", sklearn.svm.SVC())])
+    regressor = sklearn.pipeline.Pipeline([("lr", sklearn.linear_model.LinearRegression())])
+
+    with mlflow.start_run() as classifier_run:
+        classifier.fit(X, y)
+    with mlflow.start_run() as regressor_run:
+        regressor.fit(X, y)
+
+    _, classifier_metrics, _, _ = get_run_data(classifier_run.info.run_id)
+    assert "training_accuracy_score" in classifier_metrics
+    assert "training_mse" not in classifier_metrics
+
+    _, regressor_metrics, _, _ = get_run_data(regressor_run.info.run_id)
+    assert "training_mse" in regressor_metrics
+    assert "training_accuracy_score" not in regressor_metrics
+
+
 def test_get_params_returns_dict_that_has_more_keys_than_max_params_tags_per_batch():
     mlflow.sklearn.autolog()
 
@@ -360,6 +494,22 @@ def test_get_params_returns_dict_that_has_more_keys_than_max_params_tags_per_bat
     assert_predict_equal(loaded_model, model, X)
 
 
+def test_chunk_dict():
+    d = {str(i): i for i in range(5)}
+    assert list(_chunk_dict(d, chunk_size=2)) == [{"0": 0, "1": 1}, {"2": 2, "3": 3}, {"4": 4}]
+    assert list(_chunk_dict(d, chunk_size=5)) == [d]
+    assert list(_chunk_dict({}, chunk_size=2)) == []
+
+
+def test_truncate_dict_does_not_stringify_values_without_max_value_length():
+    class Unstringifiable:
+        def __str__(self):
+            raise Exception("Should not be called")
+
+    value = Unstringifiable()
+    assert _truncate_dict({"a": value}, max_key_length=MAX_ENTITY_KEY_LENGTH) == {"a": value}
+
+
 @pytest.mark.parametrize(
     "long_params, messages",
     [
@@ -455,6 +605,32 @@ def test_call_fit_with_arguments_score_does_not_accept():
     assert_predict_equal(load_model_by_run_id(run_id), model, X)
 
 
+def test_get_arg_names_excludes_self_for_bound_methods():
+    from sklearn.linear_model import SGDRegressor
+
+    unbound_arg_names = _get_arg_names(SGDRegressor.fit)
+    assert unbound_arg_names[0] == "self"
+    assert _get_arg_names(SGDRegressor().fit) == unbound_arg_names[1:]
+    # Repeated lookups are served from the cache and must not share mutable state
+    _get_arg_names(SGDRegressor().fit).append("extra_arg")
+    assert _get_arg_names(SGDRegressor().fit) == unbound_arg_names[1:]
+
+
+def test_autolog_does_not_retain_references_to_fitted_pipelines():
+    mlflow.sklearn.autolog()
+
+    # `Pipeline.score` is a wrapper that scikit-learn creates on each access and that references
+    # the pipeline, so it must not be retained by the argument names cache
+    model = sklearn.pipeline.Pipeline([("svc", sklearn.svm.SVC())])
+    with mlflow.start_run():
+        model.fit(*get_iris())
+
+    model_ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert model_ref() is None
+
+
 @pytest.mark.parametrize("sample_weight_passed_as", ["positional", "keyword"])
 def test_both_fit_and_score_contain_sample_weight(sample_weight_passed_as):
     mlflow.sklearn.autolog()
@@ -603,6 +779,22 @@ def test_autolog_emits_warning_message_when_score_fails():
         )
 
 
+def test_autolog_emits_warning_message_when_fit_arguments_cannot_be_inspected():
+    with mock.patch("mlflow.sklearn.utils._get_arg_names", side_effect=Exception("EXCEPTION")):
+        mlflow.sklearn.autolog()
+
+    with mlflow.start_run() as run, mock.patch("mlflow.sklearn._logger.warning") as mock_warning:
+        sklearn.svm.SVC().fit(*get_iris())
+
+    assert mock_warning.call_args_list[0][0][0] == (
+        "Failed to inspect the arguments of SVC.fit. The training score, metrics, artifacts "
+        "and input example will not be recorded. Inspection error: EXCEPTION"
+    )
+    _, metrics, _, artifacts = get_run_data(run.info.run_id)
+    assert metrics == {}
+    assert artifacts == [MODEL_DIR]
+
+
 def test_autolog_emits_warning_message_when_metric_fails():
     """
     Take precision_score metric from SVC as an example to test metric logging failure
@@ -660,12 +852,23 @@ def test_autolog_emits_warning_message_when_model_prediction_fails():
             cv_model.predict([[0, 0, 0, 0]])
 
         # Count how many times `mock_warning` has been called on not-fitted `predict` failure
-        call_count = len([args for args in mock_warning.call_args_list if msg in args[0][0]])
+        call_count = len(
+            [args for args in mock_warning.call_args_list if msg in args[0][0] % args[0][1:]]
+        )
         # If `_is_plotting_supported` returns True (meaning sklearn version is >= 0.22.0),
         # `mock_warning` should have been called twice, once for metrics, once for artifacts.
         # Otherwise, only once for metrics.
         call_count_expected = 2 if mlflow.sklearn.utils._is_plotting_supported() else 1
         assert call_count == call_count_expected
+        if mlflow.sklearn.utils._is_plotting_supported():
+            artifact_msg = (
+                "plot_confusion_matrix failed. "
+                "The artifact training_confusion_matrix will not be recorded."
+            )
+            assert any(
+                (args[0][0] % args[0][1:]).startswith(artifact_msg)
+                for args in mock_warning.call_args_list
+            )
 
 
 def test_fit_xxx_performs_logging_only_once(fit_func_name):